@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 import enum
-from typing import (
+import sys
+from typing import (  # noqa: F401
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Tuple,
@@ -27,6 +29,69 @@ class Sections(enum.Enum):
     NOQAS = 13
 
 
+# The symbols of nodes which the checks look up by name.  These, and
+# the keys of the docstrings' lookup tables, are interned so that the
+# lookups can compare them by identity.
+IDENT_SYMBOL = sys.intern('ident')
+ARGUMENTS_SYMBOL = sys.intern('arguments-section')
+RAISES_SYMBOL = sys.intern('raises-section')
+RETURNS_SYMBOL = sys.intern('returns-section')
+VARIABLES_SYMBOL = sys.intern('variables-section')
+YIELDS_SYMBOL = sys.intern('yields-section')
+
+
+class DocstringSnapshot(object):
+    """The parts of a docstring which the integrity checks read.
+
+    Most checks need the same few items, noqas and line numbers.
+    Since each of those is a walk over the docstring's tree, we
+    gather them all at once.
+
+    """
+
+    def __init__(self, docstring):
+        # type: (BaseDocstring) -> None
+        """Gather the values from the given docstring.
+
+        Args:
+            docstring: The docstring to take a snapshot of.
+
+        """
+        self.noqas = {
+            error: frozenset(targets)
+            for error, targets in docstring.get_noqas().items()
+        }  # type: Dict[str, FrozenSet[str]]
+
+        self.arguments = docstring.get_items(
+            Sections.ARGUMENTS_SECTION
+        ) or []  # type: List[str]
+        self.argument_types = dict(zip(
+            self.arguments,
+            docstring.get_types(Sections.ARGUMENTS_SECTION) or [],
+        ))  # type: Dict[str, Optional[str]]
+        self.arguments_line_numbers = docstring.get_line_numbers(
+            ARGUMENTS_SYMBOL,
+        )
+
+        self.raises = docstring.get_items(
+            Sections.RAISES_SECTION
+        ) or []  # type: List[str]
+        self.raises_line_numbers = docstring.get_line_numbers(
+            RAISES_SYMBOL,
+        )
+
+        self.returns = docstring.get_section(Sections.RETURNS_SECTION)
+        self.return_type = docstring.get_return_type()
+        self.returns_line_numbers = docstring.get_line_numbers(
+            RETURNS_SYMBOL,
+        )
+
+        self.yields = docstring.get_section(Sections.YIELDS_SECTION)
+        self.yields_line_numbers = docstring.get_line_numbers(
+            YIELDS_SYMBOL,
+        )
+
+
 class BaseDocstring(ABC):
     """The interface for a docstring object which can be used with checkers.
 
@@ -38,6 +103,21 @@ class BaseDocstring(ABC):
 
     """
 
+    _snapshot = None  # type: Optional[DocstringSnapshot]
+
+    def snapshot(self):
+        # type: () -> DocstringSnapshot
+        """Get the values of this docstring used by the checks.
+
+        Returns:
+            A snapshot of this docstring.  It is only created once,
+            so it should not be modified.
+
+        """
+        if self._snapshot is None:
+            self._snapshot = DocstringSnapshot(self)
+        return self._snapshot
+
     @abstractmethod
     def get_section(self, section):
         # type: (Sections) -> Optional[str]
@@ -84,6 +164,19 @@ class BaseDocstring(ABC):
         """
         pass
 
+    def get_return_type(self):
+        # type: () -> Optional[str]
+        """Get the return type, if the docstring gives exactly one.
+
+        Returns:
+            The return type, or None if it is not specified.
+
+        """
+        return_type = self.get_types(Sections.RETURNS_SECTION)
+        if not return_type or isinstance(return_type, list):
+            return None
+        return return_type
+
     @abstractmethod
     def get_items(self, section):
         # type: (Sections) -> Optional[List[str]]
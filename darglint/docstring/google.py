@@ -2,6 +2,7 @@ from collections import (
     defaultdict,
     deque,
 )
+import sys
 from typing import (  # noqa: F401
     Callable,
     Dict,
@@ -121,8 +122,8 @@ class Docstring(BaseDocstring):
             if node.annotations:
                 for annotation in node.annotations:
                     if issubclass(annotation, Identifier):
-                        lookup[annotation.key].append(node)
-            lookup[node.symbol].append(node)
+                        lookup[sys.intern(annotation.key)].append(node)
+            lookup[sys.intern(node.symbol)].append(node)
         return lookup
 
     def get_section(self, section):
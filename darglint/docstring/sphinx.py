@@ -1,4 +1,5 @@
 from collections import defaultdict
+import sys
 from typing import (  # noqa
     Callable,
     Dict,
@@ -70,10 +71,10 @@ class Docstring(BaseDocstring):
             lambda: list()
         )  # type: Dict[str, List[CykNode]]
         for node in self.root.in_order_traverse():
-            lookup[node.symbol].append(node)
+            lookup[sys.intern(node.symbol)].append(node)
             for annotation in node.annotations:
                 if issubclass(annotation, Identifier):
-                    lookup[annotation.key].append(node)
+                    lookup[sys.intern(annotation.key)].append(node)
         return lookup
 
     def get_section(self, section):
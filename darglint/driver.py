@@ -151,8 +151,7 @@ def get_error_report(filename,
         config,
         raise_errors=raise_errors_for_syntax,
     )
-    for function in functions:
-        checker.schedule(function)
+    checker.schedule_many(functions)
     return checker.get_error_report_string(
         verbosity,
         filename,
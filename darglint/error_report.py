@@ -2,8 +2,11 @@
 
 import ast  # noqa
 from collections import OrderedDict
+import io
+from operator import attrgetter
 from typing import (  # noqa
     Dict,
+    IO,
     Iterator,
     List,
     Tuple,
@@ -50,7 +53,7 @@ class ErrorReport(object):
 
     def _sort(self):
         # type: () -> None
-        self.errors.sort(key=lambda x: x.function.lineno)
+        self.errors.sort(key=attrgetter('function.lineno'))
 
     def _group_errors_by_function(self):
         # type: () -> Dict[Union[ast.FunctionDef, ast.AsyncFunctionDef], List[DarglintError]]
@@ -94,6 +97,22 @@ class ErrorReport(object):
             line=line_number,  # error.function.lineno,
         )
 
+    def write(self, stream):  # type: (IO[str]) -> None
+        """Write the errors to the stream, one per line.
+
+        There is no newline after the last error.
+
+        Args:
+            stream: A file-like object to write the errors to.
+
+        """
+        separator = ''
+        for function in self.error_dict:
+            for error in self.error_dict[function]:
+                stream.write(separator)
+                stream.write(self._get_error_description(error))
+                separator = '\n'
+
     def __str__(self):  # type: () -> str
         """Return a string representation of this error report.
 
@@ -103,11 +122,9 @@ class ErrorReport(object):
         """
         if len(self.errors) == 0:
             return ''
-        ret = list()
-        for function in self.error_dict:
-            for error in self.error_dict[function]:
-                ret.append(self._get_error_description(error))
-        return '\n'.join(ret)
+        stream = io.StringIO()
+        self.write(stream)
+        return stream.getvalue()
 
     def flake8_report(self):
         # type: () -> Iterator[Tuple[int, int, str]]
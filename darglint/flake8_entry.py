@@ -44,8 +44,7 @@ class DarglintChecker(object):
                 self.config,
                 raise_errors=False,
             )
-            for function in functions:
-                checker.run_checks(function)
+            checker.schedule_many(functions)
 
             error_report = checker.get_error_report(
                 self.verbosity,
@@ -319,11 +319,13 @@ class FunctionDescription(object):
         self.line_number = get_line_number_from_function(function)
         self.name = function.name
         if is_method:
-            self.argument_names, self.argument_types = (
+            argument_names, argument_types = (
                 _get_stripped_method_args(function)
             )
         else:
-            self.argument_names, self.argument_types = _get_arguments(function)
+            argument_names, argument_types = _get_arguments(function)
+        self.argument_names = tuple(argument_names)
+        self.argument_types = tuple(argument_types)
         self.has_return = _has_return(function)
         self.return_type = _get_return_type(function)
         self.has_yield = _has_yield(function)
@@ -1,12 +1,20 @@
 """Defines IntegrityChecker."""
 
+from functools import lru_cache
+import io
+from operator import attrgetter
 import re
-import concurrent.futures
 from typing import (  # noqa: F401
     Any,
+    Container,
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
     List,
     Set,
     Optional,
+    Tuple,
 )
 
 from .function_description import (  # noqa: F401
@@ -14,21 +22,30 @@ from .function_description import (  # noqa: F401
 )
 from .docstring.base import (  # noqa: F401
     BaseDocstring,
+    DocstringSnapshot,
     DocstringStyle,
 )
 from .docstring.base import (
+    ARGUMENTS_SYMBOL,
+    IDENT_SYMBOL,
+    RAISES_SYMBOL,
     Sections,
+    VARIABLES_SYMBOL,
 )
 from .docstring.docstring import (
     Docstring,
 )
 from .errors import (  # noqa: F401
     DarglintError,
+    EmptyDescriptionError,
+    ExcessNewlineError,
     ExcessParameterError,
     ExcessRaiseError,
     ExcessReturnError,
     ExcessVariableError,
     ExcessYieldError,
+    GenericSyntaxError,
+    IndentError,
     MissingParameterError,
     MissingRaiseError,
     MissingReturnError,
@@ -46,16 +63,62 @@ from .config import (
 )
 
 
-SYNTAX_NOQA = re.compile(r'#\s*noqa:\sS001')
+SYNTAX_NOQA = re.compile(r'#\s*noqa:\s*S001')
 EXPLICIT_GLOBAL_NOQA = re.compile(r'#\s*noqa:\s*\*')
 BARE_NOQA = re.compile(r'#\s*noqa([^:]|$)')
 
 
+# Every error the checker can report.  The first few are style
+# errors, which are annotated on the docstring by the parser.
+_ALL_ERROR_CLASSES = (
+    GenericSyntaxError,
+    EmptyDescriptionError,
+    IndentError,
+    ExcessNewlineError,
+    MissingParameterError,
+    ExcessParameterError,
+    ParameterTypeMismatchError,
+    ParameterTypeMissingError,
+    MissingReturnError,
+    ExcessReturnError,
+    ReturnTypeMismatchError,
+    MissingYieldError,
+    ExcessYieldError,
+    MissingRaiseError,
+    ExcessRaiseError,
+    ExcessVariableError,
+)
+
+
+# Parsed docstrings are cached by their source, since boilerplate
+# and inherited docstrings are often repeated verbatim.  The checks
+# only ever read from a docstring, so it is safe to share them.
+@lru_cache(maxsize=1024)
+def _parse_google(docstring):
+    # type: (str) -> BaseDocstring
+    return Docstring.from_google(docstring)
+
+
+@lru_cache(maxsize=1024)
+def _parse_sphinx(docstring):
+    # type: (str) -> BaseDocstring
+    return Docstring.from_sphinx(docstring)
+
+
 class IntegrityChecker(object):
     """Checks the integrity of the docstring compared to the definition."""
 
-    docstring = None  # type: BaseDocstring
-    function = None  # type: FunctionDescription
+    __slots__ = (
+        'errors',
+        '_sorted',
+        'config',
+        'raise_errors',
+        'docstring',
+        '_active_checks',
+        '_snapshot',
+        '_line_numbers_cache',
+        '_ignored',
+    )
 
     def __init__(self,
                  config=Configuration(
@@ -81,18 +144,35 @@ class IntegrityChecker(object):
         self._sorted = True
         self.config = config
         self.raise_errors = raise_errors
+        self.docstring = None  # type: BaseDocstring
+        self._snapshot = None  # type: DocstringSnapshot
+        self._line_numbers_cache = dict()  # type: Dict[Tuple[str, str], Optional[Tuple[int, int]]]  # noqa: E501
 
-        # TODO: Move max workers into a configuration option.
-        # A thread pool for handling checks.  Tasks are added to the
-        # pool when `schedule` is executed, if it has a docstring.
-        # The pool is collected when `get_error_report_string` is called.
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        # The error codes which have not been ignored in the
+        # configuration.  If there are none, we can skip parsing.
+        self._active_checks = frozenset(
+            error.error_code for error in _ALL_ERROR_CLASSES
+        ) - frozenset(self.config.ignore)
 
     def schedule(self, function):
         # type: (FunctionDescription) -> None
         if function.docstring is None:
             return
-        self.executor.submit(self.run_checks, function)
+        self.run_checks(function)
+
+    def schedule_many(self, functions):
+        # type: (Iterable[FunctionDescription]) -> None
+        """Schedule all of the given functions.
+
+        The functions are checked in the order they occur in the
+        source, so that the errors don't have to be sorted afterwards.
+
+        Args:
+            functions: The functions whose docstrings we are verifying.
+
+        """
+        for function in sorted(functions, key=attrgetter('function.lineno')):
+            self.schedule(function)
 
     def run_checks(self, function):
         # type: (FunctionDescription) -> None
@@ -102,68 +182,97 @@ class IntegrityChecker(object):
             function: A function whose docstring we are verifying.
 
         """
-        if function.docstring is not None:
-            if self.config.style == DocstringStyle.GOOGLE:
-                self.docstring = Docstring.from_google(
-                    function.docstring,
-                )
-            elif self.config.style == DocstringStyle.SPHINX:
-                self.docstring = Docstring.from_sphinx(
-                    function.docstring,
-                )
+        if function.docstring is None:
+            return
+
+        # Errors are appended in blocks, one per function.  Since the
+        # errors are sorted by the line of their function, the list
+        # only becomes unsorted if this function comes before the one
+        # checked previously.
+        previous_count = len(self.errors)
+        self._run_checks(function)
+        if (previous_count
+                and len(self.errors) > previous_count
+                and self.errors[previous_count - 1].function.lineno
+                > function.function.lineno):
+            self._sorted = False
+
+    def _run_checks(self, function):
+        # type: (FunctionDescription) -> None
+        if not self._active_checks:
+            return
+        self._line_numbers_cache = dict()
+        if self.config.style == DocstringStyle.GOOGLE:
+            self.docstring = _parse_google(function.docstring)
+        elif self.config.style == DocstringStyle.SPHINX:
+            self.docstring = _parse_sphinx(function.docstring)
+            if ExcessVariableError.error_code in self._active_checks:
                 self._check_variables(function)
-            if self.config.strictness != Strictness.FULL_DESCRIPTION:
-                if self.docstring.satisfies_strictness(
-                    self.config.strictness
-                ):
-                    return
-            if self.docstring.ignore_all:
+        self._snapshot = self.docstring.snapshot()
+        self._ignored = {
+            error.error_code: self._ignore_error(error)
+            for error in _ALL_ERROR_CLASSES
+        }
+        if self.config.strictness != Strictness.FULL_DESCRIPTION:
+            if self.docstring.satisfies_strictness(
+                self.config.strictness
+            ):
                 return
-            self._check_parameters(function)
-            self._check_parameter_types(function)
-            self._check_parameter_types_missing(function)
-            self._check_return(function)
-            self._check_return_type(function)
-            self._check_yield(function)
-            self._check_raises(function)
-            self._check_style(function)
-            self._sorted = False
+        if self.docstring.ignore_all:
+            return
+        self._check_parameters(function)
+        self._check_parameter_types(function)
+        self._check_parameter_types_missing(function)
+        self._check_return(function)
+        self._check_return_type(function)
+        self._check_yield(function)
+        self._check_raises(function)
+        self._check_style(function)
+
+    def _get_line_numbers_for_value(self, symbol, value, default):
+        # type: (str, str, Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]  # noqa: E501
+        """Get the line numbers for a value, caching them for this docstring.
+
+        Args:
+            symbol: The compound node which should contain the value.
+            value: The value of the node.
+            default: The line numbers to use if the value has none.
+
+        Returns:
+            The line numbers of the value, or the default.
+
+        """
+        key = (symbol, value)
+        if key not in self._line_numbers_cache:
+            self._line_numbers_cache[key] = (
+                self.docstring.get_line_numbers_for_value(symbol, value)
+            )
+        return self._line_numbers_cache[key] or default
 
     def _check_parameter_types(self, function):
         # type: (FunctionDescription) -> None
         error_code = ParameterTypeMismatchError.error_code
-        if self._ignore_error(ParameterTypeMismatchError):
+        if self._ignored[error_code]:
             return
 
-        argument_types = dict(
-            zip(self.docstring.get_items(Sections.ARGUMENTS_SECTION) or [],
-                self.docstring.get_types(Sections.ARGUMENTS_SECTION) or [])
-        )
-        doc_arg_types = list()  # type: List[Optional[str]]
-        for name in function.argument_names:
-            if name not in argument_types:
-                doc_arg_types.append(None)
-            else:
-                doc_arg_types.append(argument_types[name])
-        noqa_lookup = self.docstring.get_noqas()
-        for name, expected, actual in zip(
+        argument_types = self._snapshot.argument_types
+        noqa_set = self._snapshot.noqas.get(error_code, frozenset())
+        default_line_numbers = self._snapshot.arguments_line_numbers
+        append = self.errors.append
+        for name, expected in zip(
                 function.argument_names,
                 function.argument_types,
-                doc_arg_types,
         ):
+            actual = argument_types.get(name)
             if expected is None or actual is None:
                 continue
-            noqa_exists = error_code in noqa_lookup
-            name_has_noqa = noqa_exists and name in noqa_lookup[error_code]
-            if not (expected == actual or name_has_noqa):
-                default_line_numbers = self.docstring.get_line_numbers(
-                    'arguments-section'
-                )
-                line_numbers = self.docstring.get_line_numbers_for_value(
-                    'ident',
+            if not (expected == actual or name in noqa_set):
+                line_numbers = self._get_line_numbers_for_value(
+                    IDENT_SYMBOL,
                     name,
-                ) or default_line_numbers
-                self.errors.append(
+                    default_line_numbers,
+                )
+                append(
                     ParameterTypeMismatchError(
                         function.function,
                         name=name,
@@ -176,29 +285,22 @@ class IntegrityChecker(object):
     def _check_parameter_types_missing(self, function):
         # type: (FunctionDescription) -> None
         error_code = ParameterTypeMissingError.error_code
-        if self._ignore_error(ParameterTypeMissingError):
+        if self._ignored[error_code]:
             return
 
-        argument_types = dict(
-            zip(self.docstring.get_items(Sections.ARGUMENTS_SECTION) or [],
-                self.docstring.get_types(Sections.ARGUMENTS_SECTION) or [])
-        )
-
-        noqa_lookup = self.docstring.get_noqas()
-        noqa_exists = error_code in noqa_lookup
+        argument_types = self._snapshot.argument_types
+        noqa_set = self._snapshot.noqas.get(error_code, frozenset())
+        default_line_numbers = self._snapshot.arguments_line_numbers
 
+        append = self.errors.append
         for name, argument_type in argument_types.items():
-            name_has_no_qa = noqa_exists and name in noqa_lookup[error_code]
-
-            if argument_type is None and not name_has_no_qa:
-                default_line_numbers = self.docstring.get_line_numbers(
-                    'arguments-section'
-                )
-                line_numbers = self.docstring.get_line_numbers_for_value(
-                    'ident',
+            if argument_type is None and name not in noqa_set:
+                line_numbers = self._get_line_numbers_for_value(
+                    IDENT_SYMBOL,
                     name,
-                ) or default_line_numbers
-                self.errors.append(
+                    default_line_numbers,
+                )
+                append(
                     ParameterTypeMissingError(
                         function.function,
                         name=name,
@@ -208,18 +310,14 @@ class IntegrityChecker(object):
 
     def _check_return_type(self, function):
         # type: (FunctionDescription) -> None
-        if self._ignore_error(ReturnTypeMismatchError):
+        if self._ignored[ReturnTypeMismatchError.error_code]:
             return
 
         fun_type = function.return_type
-        doc_type = self.docstring.get_types(Sections.RETURNS_SECTION)
-        if not doc_type or isinstance(doc_type, list):
-            doc_type = None
+        doc_type = self._snapshot.return_type
         if fun_type is not None and doc_type is not None:
             if fun_type != doc_type:
-                line_numbers = self.docstring.get_line_numbers(
-                    'returns-section',
-                )
+                line_numbers = self._snapshot.returns_line_numbers
                 self.errors.append(
                     ReturnTypeMismatchError(
                         function.function,
@@ -231,18 +329,16 @@ class IntegrityChecker(object):
 
     def _check_yield(self, function):
         # type: (FunctionDescription) -> None
-        doc_yield = self.docstring.get_section(Sections.YIELDS_SECTION)
+        doc_yield = self._snapshot.yields
         fun_yield = function.has_yield
-        ignore_missing = self._ignore_error(MissingYieldError)
-        ignore_excess = self._ignore_error(ExcessYieldError)
+        ignore_missing = self._ignored[MissingYieldError.error_code]
+        ignore_excess = self._ignored[ExcessYieldError.error_code]
         if fun_yield and not doc_yield and not ignore_missing:
             self.errors.append(
                 MissingYieldError(function.function)
             )
         elif doc_yield and not fun_yield and not ignore_excess:
-            line_numbers = self.docstring.get_line_numbers(
-                'yields-section',
-            )
+            line_numbers = self._snapshot.yields_line_numbers
             self.errors.append(
                 ExcessYieldError(
                     function.function,
@@ -252,18 +348,16 @@ class IntegrityChecker(object):
 
     def _check_return(self, function):
         # type: (FunctionDescription) -> None
-        doc_return = self.docstring.get_section(Sections.RETURNS_SECTION)
+        doc_return = self._snapshot.returns
         fun_return = function.has_return
-        ignore_missing = self._ignore_error(MissingReturnError)
-        ignore_excess = self._ignore_error(ExcessReturnError)
+        ignore_missing = self._ignored[MissingReturnError.error_code]
+        ignore_excess = self._ignored[ExcessReturnError.error_code]
         if fun_return and not doc_return and not ignore_missing:
             self.errors.append(
                 MissingReturnError(function.function)
             )
         elif doc_return and not fun_return and not ignore_excess:
-            line_numbers = self.docstring.get_line_numbers(
-                'returns-section',
-            )
+            line_numbers = self._snapshot.returns_line_numbers
             self.errors.append(
                 ExcessReturnError(
                     function.function,
@@ -273,27 +367,20 @@ class IntegrityChecker(object):
 
     def _check_parameters(self, function):
         # type: (FunctionDescription) -> None
-        # argument_types = self.docstring.get_argument_types()
-        # docstring_arguments = set(argument_types.keys())
-        docstring_arguments = set(self.docstring.get_items(
-            Sections.ARGUMENTS_SECTION
-        ) or [])
-        actual_arguments = set(function.argument_names)
-        missing_in_doc = actual_arguments - docstring_arguments
-        missing_in_doc = self._remove_ignored(
-            missing_in_doc,
-            MissingParameterError,
-        )
+        docstring_arguments = set(self._snapshot.arguments)
 
         # Get a default line number.
-        default_line_numbers = self.docstring.get_line_numbers(
-            'arguments-section'
-        )
+        default_line_numbers = self._snapshot.arguments_line_numbers
 
-        for missing in missing_in_doc:
+        append = self.errors.append
+        for missing in self._filter_ignored(
+            function.argument_names,
+            docstring_arguments,
+            MissingParameterError,
+        ):
             # We use the default line numbers because a missing
             # parameter, by definition, will not have line numbers.
-            self.errors.append(
+            append(
                 MissingParameterError(
                     function.function,
                     missing,
@@ -301,17 +388,17 @@ class IntegrityChecker(object):
                 )
             )
 
-        missing_in_function = docstring_arguments - actual_arguments
-        missing_in_function = self._remove_ignored(
-            missing_in_function,
+        for missing in self._filter_ignored(
+            self._snapshot.arguments,
+            set(function.argument_names),
             ExcessParameterError,
-        )
-        for missing in missing_in_function:
-            line_numbers = self.docstring.get_line_numbers_for_value(
-                'arguments-section',
+        ):
+            line_numbers = self._get_line_numbers_for_value(
+                ARGUMENTS_SYMBOL,
                 missing,
-            ) or default_line_numbers
-            self.errors.append(
+                default_line_numbers,
+            )
+            append(
                 ExcessParameterError(
                     function.function,
                     missing,
@@ -329,15 +416,17 @@ class IntegrityChecker(object):
 
         # Get a default line number.
         default_line_numbers = self.docstring.get_line_numbers(
-            'variables-section',
+            VARIABLES_SYMBOL,
         )
 
+        append = self.errors.append
         for excess in excess_in_doc:
-            line_numbers = self.docstring.get_line_numbers_for_value(
-                'variables-section',
+            line_numbers = self._get_line_numbers_for_value(
+                VARIABLES_SYMBOL,
                 excess,
-            ) or default_line_numbers
-            self.errors.append(
+                default_line_numbers,
+            )
+            append(
                 ExcessVariableError(
                     function.function,
                     excess,
@@ -360,61 +449,59 @@ class IntegrityChecker(object):
         error_code = error.error_code
         if error_code in self.config.ignore:
             return True
-        noqa_lookup = self.docstring.get_noqas()
-        inline_error = error_code in noqa_lookup
-        if inline_error and not noqa_lookup[error_code]:
+        noqa_sets = self._snapshot.noqas
+        inline_error = error_code in noqa_sets
+        if inline_error and not noqa_sets[error_code]:
             return True
         return False
 
-    def _remove_ignored(self, missing, error):
-        # type: (Set[str], Any) -> Set[str]
-        """Remove ignored from missing.
+    def _filter_ignored(self, candidates, exclude, error):
+        # type: (Iterable[str], Container[str], Any) -> Iterator[str]
+        """Yield the candidates which should be reported.
 
         Args:
-            missing: A set of missing items.
+            candidates: The items which might be in error.
+            exclude: Items which are not in error.  (For example,
+                those which are described in the docstring.)
             error: The error being checked.
 
-        Returns:
-            A set of missing items without those to be ignored.
+        Yields:
+            Each candidate which is not excluded or ignored.
 
         """
-        error_code = error.error_code
-
         # Ignore globally
-        if self._ignore_error(error):
-            return set()
-
-        # There are no noqa statements
-        noqa_lookup = self.docstring.get_noqas()
-        inline_ignore = error_code in noqa_lookup
-        if not inline_ignore:
-            return missing
+        if self._ignored[error.error_code]:
+            return
 
         # We are to ignore specific instances.
-        return missing - set(noqa_lookup[error_code])
+        noqa_set = self._snapshot.noqas.get(error.error_code, frozenset())
+        for candidate in candidates:
+            if candidate not in exclude and candidate not in noqa_set:
+                yield candidate
 
     def _check_style(self, function):
         # type: (FunctionDescription) -> None
+        append = self.errors.append
         for StyleError, line_numbers in self.docstring.get_style_errors():
-            self.errors.append(StyleError(
+            if StyleError.error_code not in self._active_checks:
+                continue
+            append(StyleError(
                 function.function,
                 line_numbers,
             ))
 
     def _check_raises(self, function):
         # type: (FunctionDescription) -> None
-        exception_types = self.docstring.get_items(Sections.RAISES_SECTION)
-        docstring_raises = set(exception_types or [])
+        docstring_raises = set(self._snapshot.raises)
         actual_raises = function.raises
-        missing_in_doc = actual_raises - docstring_raises
 
-        missing_in_doc = self._remove_ignored(
-            missing_in_doc,
+        append = self.errors.append
+        for missing in self._filter_ignored(
+            actual_raises,
+            docstring_raises,
             MissingRaiseError,
-        )
-
-        for missing in missing_in_doc:
-            self.errors.append(
+        ):
+            append(
                 MissingRaiseError(function.function, missing)
             )
 
@@ -424,20 +511,18 @@ class IntegrityChecker(object):
         # would know if this function would be likely to raise
         # a certain exception from underlying calls.
         #
-        missing_in_function = docstring_raises - actual_raises
-        missing_in_function = self._remove_ignored(
-            missing_in_function,
+        default_line_numbers = self._snapshot.raises_line_numbers
+        for missing in self._filter_ignored(
+            docstring_raises,
+            actual_raises,
             ExcessRaiseError,
-        )
-        default_line_numbers = self.docstring.get_line_numbers(
-            'raises-section',
-        )
-        for missing in missing_in_function:
-            line_numbers = self.docstring.get_line_numbers_for_value(
-                'raises-section',
+        ):
+            line_numbers = self._get_line_numbers_for_value(
+                RAISES_SYMBOL,
                 missing,
-            ) or default_line_numbers
-            self.errors.append(
+                default_line_numbers,
+            )
+            append(
                 ExcessRaiseError(
                     function.function,
                     missing,
@@ -448,12 +533,12 @@ class IntegrityChecker(object):
     def _sort(self):
         # type: () -> None
         if not self._sorted:
-            self.errors.sort(key=lambda x: x.function.lineno)
+            self.errors.sort(key=attrgetter('function.lineno'))
             self._sorted = True
 
     def get_error_report(self, verbosity, filename, message_template=None):
         # type: (int, str, str) -> ErrorReport
-        self.executor.shutdown()
+        self._sort()
         return ErrorReport(
             errors=self.errors,
             filename=filename,
@@ -479,6 +564,29 @@ class IntegrityChecker(object):
             A string representation of the errors.
 
         """
-        return str(self.get_error_report(
+        stream = io.StringIO()
+        self.write_error_report(
+            stream, verbosity, filename, message_template
+        )
+        return stream.getvalue()
+
+    def write_error_report(self,
+                           stream,
+                           verbosity,
+                           filename,
+                           message_template=None):
+        # type: (IO[str], int, str, str) -> None
+        """Write the errors to the stream, one per line.
+
+        Args:
+            stream: A file-like object to write the errors to.
+            verbosity: The level of verbosity.  Should be an integer
+                in the range [1,3].
+            filename: The filename of where the error occurred.
+            message_template: A python format string for describing
+                how the error reports should look to the user.
+
+        """
+        self.get_error_report(
             verbosity, filename, message_template
-        ))
+        ).write(stream)
@@ -353,6 +353,19 @@ class DocstringMethodTest(TestCase):
             docstring.get_types(Sections.RETURNS_SECTION),
             'Alcohol',
         )
+        self.assertEqual(docstring.get_return_type(), 'Alcohol')
+
+    def test_get_return_type_none_if_not_given(self):
+        """Make sure a returns section without a type has no type."""
+        root = '\n'.join([
+            'Ferment potato.',
+            '',
+            'Returns:',
+            '    Vodka.',
+            '\n',
+        ])
+        docstring = Docstring.from_google(root)
+        self.assertIsNone(docstring.get_return_type())
 
     def test_get_yields_description(self):
         """Make sure we can get the yields description."""
@@ -437,6 +450,32 @@ class DocstringMethodTest(TestCase):
             },
         )
 
+    def test_snapshot(self):
+        """Make sure the snapshot gathers the values used by checks."""
+        root = '\n'.join([
+            'Snapshot.',
+            '',
+            'Args:',
+            '    x (int): Something. # noqa: DAR103',
+            '    y: Something else.',
+            '',
+            'Raises:',
+            '    ValueError: Sometimes.',
+            '',
+            'Returns:',
+            '    The sum.',
+            '\n',
+        ])
+        docstring = Docstring.from_google(root)
+        snapshot = docstring.snapshot()
+        self.assertEqual(snapshot.noqas, {'DAR103': frozenset({'x'})})
+        self.assertEqual(snapshot.arguments, ['x', 'y'])
+        self.assertEqual(snapshot.argument_types, {'x': 'int', 'y': None})
+        self.assertEqual(snapshot.raises, ['ValueError'])
+        self.assertEqual(snapshot.returns, 'Returns:\n    The sum.')
+        self.assertIsNone(snapshot.yields)
+        self.assertIs(docstring.snapshot(), snapshot)
+
     def test_get_noqas_with_exception(self):
         root = '\n'.join([
             'Noqa-full.',
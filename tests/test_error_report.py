@@ -1,6 +1,7 @@
 """Tests for the error reporting class."""
 
 import ast
+import io
 from unittest import TestCase
 
 from darglint.error_report import ErrorReport
@@ -134,3 +135,20 @@ class ErrorReportMessageTemplateTest(TestCase):
                 EmptyDescriptionError.error_code in error_repr,
             ])
         )
+
+    def test_write_separates_errors_by_newlines(self):
+        errors = [
+            EmptyDescriptionError(self.function_description, message)
+            for message in ['First', 'Second']
+        ]
+        error_report = ErrorReport(
+            errors=errors,
+            filename='./some_filename.py',
+            message_template='{msg_id}',
+        )
+        stream = io.StringIO()
+        error_report.write(stream)
+        self.assertEqual(
+            stream.getvalue(),
+            '\n'.join([EmptyDescriptionError.error_code] * 2),
+        )
@@ -14,7 +14,7 @@ class GetFunctionsAndDocstrings(TestCase):
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
         self.assertEqual(function.name, 'top_level_function')
-        self.assertEqual(function.argument_names, ['arg'])
+        self.assertEqual(function.argument_names, ('arg',))
         self.assertEqual(function.has_return, True)
         self.assertEqual(function.docstring, 'My docstring')
 
@@ -30,7 +30,7 @@ class GetFunctionsAndDocstrings(TestCase):
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
         self.assertEqual(function.name, 'my_method')
-        self.assertEqual(function.argument_names, ['arg1', 'arg2'])
+        self.assertEqual(function.argument_names, ('arg1', 'arg2'))
         self.assertEqual(function.has_return, True)
         self.assertEqual(function.docstring, 'But this one.')
 
@@ -45,7 +45,7 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_names, ['arg1'])
+        self.assertEqual(function.argument_names, ('arg1',))
 
     def test_setters_and_getters_treated_like_normal_methods(self):
         program = '\n'.join([
@@ -57,7 +57,7 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_names, ['value'])
+        self.assertEqual(function.argument_names, ('value',))
 
     def test_tells_if_not_fruitful(self):
         program = '\n'.join([
@@ -121,7 +121,7 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_types, ['int'])
+        self.assertEqual(function.argument_types, ('int',))
 
     def test_argument_types_are_non_if_not_specified(self):
         program = '\n'.join([
@@ -130,7 +130,7 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_types, [None])
+        self.assertEqual(function.argument_types, (None,))
 
     def test_extracts_return_type(self):
         program = '\n'.join([
@@ -157,7 +157,7 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_names, ['*nums'])
+        self.assertEqual(function.argument_names, ('*nums',))
 
     def test_multiple_returns_has_returns(self):
         program = '\n'.join([
@@ -181,8 +181,8 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_names, ['a', 'b', 'key'])
-        self.assertEqual(function.argument_types, [None, None, None])
+        self.assertEqual(function.argument_names, ('a', 'b', 'key'))
+        self.assertEqual(function.argument_types, (None, None, None))
 
     def test_keyword_only_arguments_with_type_hints(self):
         program = '\n'.join([
@@ -191,5 +191,5 @@ class GetFunctionsAndDocstrings(TestCase):
         ])
         tree = ast.parse(program)
         function = get_function_descriptions(tree)[0]
-        self.assertEqual(function.argument_names, ['a', 'key'])
-        self.assertEqual(function.argument_types, ['int', 'bool'])
+        self.assertEqual(function.argument_names, ('a', 'key'))
+        self.assertEqual(function.argument_types, ('int', 'bool'))
@@ -200,6 +200,63 @@ class IntegrityCheckerTestCase(TestCase):
         self.assertEqual(len(errors), 1)
         self.assertTrue(isinstance(errors[0], MissingReturnError))
 
+    def test_identical_docstrings_checked_against_each_function(self):
+        program = '\n'.join([
+            'def first(x):',
+            '    """Do something.',
+            '',
+            '    Args:',
+            '        y: An argument.',
+            '',
+            '    """',
+            '    print(x)',
+            '',
+            'def second(y):',
+            '    """Do something.',
+            '',
+            '    Args:',
+            '        y: An argument.',
+            '',
+            '    """',
+            '    print(y)',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker()
+        for function in functions:
+            checker.run_checks(function)
+        errors = {
+            (error.function.name, error.__class__)
+            for error in checker.errors
+        }
+        self.assertEqual(errors, {
+            ('first', MissingParameterError),
+            ('first', ExcessParameterError),
+        })
+
+    def test_schedule_many_checks_functions_in_source_order(self):
+        program = '\n'.join([
+            'def first(x):',
+            '    """Do something."""',
+            '    print(x)',
+            '',
+            'def second(y):',
+            '    """Do something."""',
+            '    print(y)',
+            '',
+            'def third(z):',
+            '    """Do something."""',
+            '    print(z)',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker()
+        checker.schedule_many(reversed(functions))
+        self.assertEqual(
+            [error.function.name for error in checker.errors],
+            ['first', 'second', 'third'],
+        )
+
     def test_skips_functions_without_docstrings(self):
         program = '\n'.join([
             'def function_without_docstring(arg1, arg2):',
@@ -611,6 +668,53 @@ class IntegrityCheckerTestCase(TestCase):
         errors = checker.errors
         self.assertTrue(isinstance(errors[0], IndentError))
 
+    def test_style_errors_can_be_ignored_in_config(self):
+        program = '\n'.join([
+            'def hash_integer(value):',
+            '    """Return the hash value of an integer.',
+            '',
+            '    Args:',
+            '        value: The integer that we want',
+            '        to make a hashed value of.',
+            '',
+            '    Returns:',
+            '        The hashed value.',
+            '',
+            '    """',
+            '    return value % 7',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker(config=Configuration(
+            ignore=[IndentError.error_code],
+            message_template=None,
+            style=DocstringStyle.GOOGLE,
+            strictness=Strictness.FULL_DESCRIPTION,
+        ))
+        checker.run_checks(functions[0])
+        self.assertFalse(any(
+            isinstance(error, IndentError) for error in checker.errors
+        ))
+
+    def test_docstring_not_parsed_if_all_errors_ignored(self):
+        program = '\n'.join([
+            'def hash_integer(value):',
+            '    """Return the hash value of an integer."""',
+            '    return value % 7',
+        ])
+        tree = ast.parse(program)
+        functions = get_function_descriptions(tree)
+        checker = IntegrityChecker(config=Configuration(
+            # Covers every error code darglint can report.
+            ignore=['DAR{:03}'.format(i) for i in range(600)],
+            message_template=None,
+            style=DocstringStyle.GOOGLE,
+            strictness=Strictness.FULL_DESCRIPTION,
+        ))
+        checker.run_checks(functions[0])
+        self.assertEqual(checker.errors, [])
+        self.assertIsNone(checker.docstring)
+
     def test_raises_style_error_if_no_content_after_colon(self):
         program = '\n'.join([
             'def hello_world(name):',